@@ -5,9 +5,12 @@ from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
 from typing import Any, TYPE_CHECKING
+import json
 import subprocess
 import threading
 
+import orjson
+
 if TYPE_CHECKING:
     import logging
     from pitlane.config import McpServerConfig
@@ -73,6 +76,24 @@ class BaseAssistant(ABC):
         return None
 
 
+def parse_json_line(line: str) -> dict[str, Any] | None:
+    """Parse one line of an assistant's JSON event stream, or None if it isn't one.
+
+    Console chatter never starts with "{", so it is rejected without a parse.
+    orjson rejects NaN/Infinity and lone surrogates that json accepts, so a
+    line orjson can't decode is retried with json before being given up on.
+    """
+    if not line.lstrip().startswith("{"):
+        return None
+    try:
+        return orjson.loads(line)
+    except orjson.JSONDecodeError:
+        try:
+            return json.loads(line)
+        except json.JSONDecodeError:
+            return None
+
+
 def run_command_with_live_logging(
     cmd: list[str],
     workdir: Path,
@@ -89,6 +110,10 @@ def run_command_with_live_logging(
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
         text=True,
+        # Sizes the userspace BufferedReader over each pipe (default 8 KiB),
+        # not the kernel pipe's capacity: bursts of output are pulled in with
+        # fewer read() syscalls, while reads still return whatever is ready
+        bufsize=65536,
         env=env,
     )
 
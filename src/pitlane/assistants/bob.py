@@ -14,12 +14,15 @@ from pitlane.assistants.base import (
     AssistantFeature,
     AssistantResult,
     BaseAssistant,
+    parse_json_line,
     run_command_with_live_logging,
 )
 
 if TYPE_CHECKING:
     import logging
 
+_COST_RE = re.compile(r"Cost:\s*(\d*\.?\d+)")
+
 
 class BobAssistant(BaseAssistant):
     def cli_name(self) -> str:
@@ -86,7 +89,7 @@ class BobAssistant(BaseAssistant):
         """Parse stream-json (NDJSON) output from bob CLI.
 
         Each line is either a JSON event object or non-JSON console output.
-        Non-JSON lines are silently skipped.
+        Lines that are not JSON objects are silently skipped.
         """
         conversation: list[dict] = []
         token_usage = None
@@ -94,9 +97,8 @@ class BobAssistant(BaseAssistant):
         tool_calls_count = 0
 
         for line in stdout.splitlines():
-            try:
-                event = json.loads(line)
-            except json.JSONDecodeError:
+            event = parse_json_line(line)
+            if event is None:
                 continue
 
             event_type = event.get("type")
@@ -125,7 +127,7 @@ class BobAssistant(BaseAssistant):
             elif event_type == "message":
                 content = event.get("content", "")
                 if "Cost:" in content:
-                    m = re.search(r"Cost:\s*([\d.]+)", content)
+                    m = _COST_RE.search(content)
                     if m:
                         cost = float(m.group(1))
 
@@ -13,6 +13,7 @@ from pitlane.assistants.base import (
     AssistantFeature,
     AssistantResult,
     BaseAssistant,
+    parse_json_line,
     run_command_with_live_logging,
 )
 
@@ -111,12 +112,9 @@ class OpenCodeAssistant(BaseAssistant):
         total_cost = 0.0
         tool_calls_count = 0
 
-        for line in stdout.strip().splitlines():
-            if not line.strip():
-                continue
-            try:
-                msg = json.loads(line)
-            except json.JSONDecodeError:
+        for line in stdout.splitlines():
+            msg = parse_json_line(line)
+            if msg is None:
                 continue
 
             msg_type = msg.get("type", "")
@@ -253,7 +253,7 @@ def schema_generate(
     ),
 ):
     """Generate JSON Schema and docs for the eval YAML format."""
-    from pitlane.schema import write_json_schema, write_schema_doc
+    from pitlane.schema import write_schema_files
 
     project_dir = Path(dir)
     out_path = (
@@ -262,8 +262,7 @@ def schema_generate(
         else project_dir / "schemas" / "pitlane.schema.json"
     )
     doc_path = Path(doc) if doc is not None else project_dir / "docs" / "schema.md"
-    write_json_schema(out_path)
-    write_schema_doc(doc_path)
+    write_schema_files(out_path, doc_path)
     typer.echo(f"Wrote schema: {out_path}")
     typer.echo(f"Wrote docs: {doc_path}")
 
@@ -320,7 +319,7 @@ def schema_install(
         plan_vscode_settings_update,
         write_json_atomic,
     )
-    from pitlane.schema import write_json_schema, write_schema_doc
+    from pitlane.schema import write_schema_files
 
     project_dir = Path(dir)
     out_path = (
@@ -350,8 +349,7 @@ def schema_install(
         )
         raise typer.Exit(1)
 
-    write_json_schema(out_path)
-    write_schema_doc(doc_path)
+    write_schema_files(out_path, doc_path)
     typer.echo(f"Wrote schema: {out_path}")
     typer.echo(f"Wrote docs: {doc_path}")
 
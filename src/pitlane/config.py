@@ -47,6 +47,9 @@ class McpServerConfig(BaseModel):
         """
         missing: list[str] = []
         for key, value in self.env.items():
+            # Plain values (the common case) have nothing for expandvars to resolve
+            if "$" not in value and "\\" not in value:
+                continue
             try:
                 expandvars(value, nounset=True)
             except Exception:
@@ -72,22 +72,29 @@ def write_junit(run_dir: Path, all_results: dict[str, dict[str, Any]]) -> Path:
                                     f"{metric_name}_{stat_name}", str(stat_val)
                                 )
 
-            # Test cases: one per assertion
+            # Test cases: one per assertion. Use append (not add_testcase, which
+            # recounts every case on each call) and tally failures in the same pass.
+            n_failures = 0
             for assertion in assertions:
                 case = TestCase(assertion["name"])
                 case.classname = task_name
                 if not assertion.get("passed", True):
                     case.result = Failure(assertion.get("message", ""))
-                suite.add_testcase(case)
+                    n_failures += 1
+                suite.append(case)
 
-            # Set time after add_testcase (add_testcase resets it via update_statistics)
+            suite.tests = len(assertions)
+            suite.errors = 0
+            suite.failures = n_failures
+            suite.skipped = 0
             suite.time = float(metrics.get("wall_clock_seconds") or 0.0)
 
             # Use append (not +=) to preserve properties and time
             xml.append(suite)
 
     junit_path = run_dir / "junit.xml"
-    xml.write(str(junit_path), pretty=True)
+    # Compact output: junit.xml is read by tools, and pretty-printing goes through minidom
+    xml.write(str(junit_path))
     return junit_path
 
 
@@ -97,6 +104,8 @@ def generate_report(run_dir: Path) -> Path:
     from jinja2 import Environment, FileSystemLoader
     from junitparser import JUnitXml
 
+    from pitlane.yaml_compat import SafeLoader
+
     junit_path = run_dir / "junit.xml"
     report_path = run_dir / "report.html"
 
@@ -105,7 +114,7 @@ def generate_report(run_dir: Path) -> Path:
     meta_path = run_dir / "meta.yaml"
     if meta_path.exists():
         try:
-            meta = yaml.safe_load(meta_path.read_text()) or {}
+            meta = yaml.load(meta_path.read_text(), Loader=SafeLoader) or {}
         except Exception:
             pass
 
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 import logging
+from collections import defaultdict
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, asdict
 from datetime import datetime, timezone
@@ -20,6 +21,7 @@ from pitlane.metrics import (
 )
 from pitlane.verbose import setup_logger
 from pitlane.workspace import WorkspaceManager
+from pitlane.yaml_compat import SafeDumper
 
 AssistantName = str
 TaskName = str
@@ -59,6 +61,8 @@ class Runner:
         self.parallel_tasks = parallel_tasks
         self.repeat = repeat
         self.interrupted = False
+        # `<cli> --version` results, probed once per CLI for the whole run
+        self._cli_versions: dict[str, str | None] = {}
 
     def execute(self) -> Path:
         """Run all tasks against all assistants. Returns the run directory."""
@@ -96,7 +100,7 @@ class Runner:
         cli_versions = {}
         for assistant_name, assistant_config in assistants.items():
             assistant = get_assistant(assistant_config.type)
-            version = assistant.get_cli_version()
+            version = self._get_cli_version(assistant)
             if version:
                 cli_versions[f"{assistant_name} ({assistant.cli_name()})"] = version
 
@@ -133,6 +137,10 @@ class Runner:
             ] = {}
             for assistant_name in assistants:
                 iteration_results[assistant_name] = {}
+            # Iteration indices already collected per (assistant, task), for O(1) dedupe
+            seen_iterations: dict[tuple[AssistantName, TaskName], set[int]] = (
+                defaultdict(set)
+            )
 
             completed_count = 0
             try:
@@ -168,6 +176,7 @@ class Runner:
                         if task_name not in iteration_results[assistant_name]:
                             iteration_results[assistant_name][task_name] = []
                         iteration_results[assistant_name][task_name].append(result)
+                        seen_iterations[(assistant_name, task_name)].add(iteration)
                     except Exception as e:
                         completed_count += 1
                         label = f"{assistant_name} / {task_name}"
@@ -218,10 +227,9 @@ class Runner:
                                 iteration_index=iteration,
                             )
                             # Only add if not already collected
-                            if not any(
-                                r.iteration_index == iteration
-                                for r in iteration_results[assistant_name][task_name]
-                            ):
+                            seen = seen_iterations[(assistant_name, task_name)]
+                            if iteration not in seen:
+                                seen.add(iteration)
                                 iteration_results[assistant_name][task_name].append(
                                     result
                                 )
@@ -245,6 +253,13 @@ class Runner:
 
         return run_dir
 
+    def _get_cli_version(self, assistant: BaseAssistant) -> str | None:
+        """Return the assistant's CLI version, spawning the probe only once per CLI."""
+        cli = assistant.cli_name()
+        if cli not in self._cli_versions:
+            self._cli_versions[cli] = assistant.get_cli_version()
+        return self._cli_versions[cli]
+
     def _write_results(
         self,
         run_dir: Path,
@@ -277,7 +292,9 @@ class Runner:
         if self.interrupted:
             meta["interrupted"] = True
 
-        (run_dir / "meta.yaml").write_text(yaml.dump(meta, default_flow_style=False))
+        (run_dir / "meta.yaml").write_text(
+            yaml.dump(meta, Dumper=SafeDumper, default_flow_style=False)
+        )
 
     def _run_task(
         self,
@@ -319,7 +336,7 @@ class Runner:
         }
 
         # Log CLI version information
-        cli_version = assistant.get_cli_version()
+        cli_version = self._get_cli_version(assistant)
         if cli_version:
             task_logger.debug(
                 f"Using {assistant.cli_name()} CLI version: {cli_version}"
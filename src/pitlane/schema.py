@@ -2,12 +2,17 @@
 
 from __future__ import annotations
 
+import copy
+import functools
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Iterable
 
 from pitlane.config import EvalConfig
 
+_DEFS_PREFIX = "#/$defs/"
+
 
 def _ensure_parent(path: Path) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
@@ -16,108 +21,158 @@ def _ensure_parent(path: Path) -> None:
 def _collect_refs(obj: object) -> set[str]:
     """Return all ``$defs`` names referenced via ``$ref`` inside *obj*."""
     refs: set[str] = set()
-    if isinstance(obj, dict):
-        if "$ref" in obj:
-            ref = obj["$ref"]
-            if ref.startswith("#/$defs/"):
-                refs.add(ref.removeprefix("#/$defs/"))
-        for v in obj.values():
-            refs |= _collect_refs(v)
-    elif isinstance(obj, list):
-        for v in obj:
-            refs |= _collect_refs(v)
+    stack = [obj]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            ref = node.get("$ref")
+            if isinstance(ref, str):
+                if ref.startswith(_DEFS_PREFIX):
+                    refs.add(ref[len(_DEFS_PREFIX) :])
+                if len(node) == 1:
+                    # Bare reference (the common Pydantic shape): nothing below it
+                    continue
+            stack.extend(node.values())
+        elif isinstance(node, list):
+            stack.extend(node)
     return refs
 
 
 def _order_defs(defs: dict) -> dict:
     """Topologically sort ``$defs`` so referenced types precede referencing types."""
-    ordered: dict[str, dict] = {}
+    # Sorted so that siblings are emitted in a stable order across runs
+    deps = {name: sorted(_collect_refs(d)) for name, d in defs.items()}
+    order: list[str] = []
     visited: set[str] = set()
 
-    def _visit(name: str) -> None:
-        if name in visited or name not in defs:
-            return
-        visited.add(name)
-        for dep in _collect_refs(defs[name]):
-            _visit(dep)
-        ordered[name] = defs[name]
-
-    for name in defs:
-        _visit(name)
-    return ordered
-
-
-def generate_json_schema() -> dict:
+    for root in defs:
+        if root in visited:
+            continue
+        visited.add(root)
+        stack = [(root, iter(deps[root]))]
+        while stack:
+            name, pending = stack[-1]
+            for dep in pending:
+                if dep not in visited and dep in defs:
+                    visited.add(dep)
+                    stack.append((dep, iter(deps[dep])))
+                    break
+            else:
+                stack.pop()
+                order.append(name)
+
+    return {name: defs[name] for name in order}
+
+
+@functools.lru_cache(maxsize=1)
+def _build_json_schema() -> dict:
+    """Build the schema once per process; callers must not mutate the result.
+
+    Deliberately not persisted to disk: the build takes a few milliseconds, far
+    less than importing the models that a cache fingerprint would depend on.
+    """
     schema = EvalConfig.model_json_schema()
     if "$defs" in schema:
         schema["$defs"] = _order_defs(schema["$defs"])
     return schema
 
 
+@functools.lru_cache(maxsize=1)
+def _json_schema_text() -> str:
+    return json.dumps(_build_json_schema(), indent=2) + "\n"
+
+
+def generate_json_schema() -> dict:
+    return copy.deepcopy(_build_json_schema())
+
+
 def write_json_schema(path: Path) -> None:
     _ensure_parent(path)
-    schema = generate_json_schema()
-    path.write_text(json.dumps(schema, indent=2) + "\n")
+    path.write_text(_json_schema_text())
+
+
+_DOC_HEADER = """\
+# pitlane YAML Schema
+
+This doc is generated from the Pydantic models.
+
+## Top-level keys
+- `assistants`: mapping of assistant names to config.
+- `tasks`: list of task definitions.
+
+## Assistant Config
+- `type`: string (required) - one of: bob, claude-code, mistral-vibe, opencode
+- `args`: object (optional) - assistant-specific arguments
+- `skills`: array (optional) - list of skill references
+
+## Assertions
+"""
+
+
+_ASSERTION_MODELS = (
+    "FileExistsAssertion",
+    "FileContainsAssertion",
+    "CommandSucceedsAssertion",
+    "CommandFailsAssertion",
+    "BleuAssertion",
+    "RougeAssertion",
+    "BERTScoreAssertion",
+    "CosineSimilarityAssertion",
+)
+
+# Assertion key -> $defs entry describing its object form (absent means a string)
+_SPEC_FOR_TOP_KEY = {
+    "file_contains": "FileContainsSpec",
+    "bleu": "SimilaritySpec",
+    "rouge": "SimilaritySpec",
+    "bertscore": "SimilaritySpec",
+    "cosine_similarity": "SimilaritySpec",
+}
 
 
 def _format_fields(fields: Iterable[str]) -> str:
     return ", ".join(fields)
 
 
-def generate_schema_doc() -> str:
-    schema = generate_json_schema()
+def _render_schema_doc(schema: dict) -> str:
     defs = schema.get("$defs", {})
 
-    assertion_models = [
-        "FileExistsAssertion",
-        "FileContainsAssertion",
-        "CommandSucceedsAssertion",
-        "CommandFailsAssertion",
-        "BleuAssertion",
-        "RougeAssertion",
-        "BERTScoreAssertion",
-        "CosineSimilarityAssertion",
-    ]
-
-    lines: list[str] = []
-    lines.append("# pitlane YAML Schema")
-    lines.append("")
-    lines.append("This doc is generated from the Pydantic models.")
-    lines.append("")
-    lines.append("## Top-level keys")
-    lines.append("- `assistants`: mapping of assistant names to config.")
-    lines.append("- `tasks`: list of task definitions.")
-    lines.append("")
-    lines.append("## Assistant Config")
-    lines.append(
-        "- `type`: string (required) - one of: bob, claude-code, mistral-vibe, opencode"
-    )
-    lines.append("- `args`: object (optional) - assistant-specific arguments")
-    lines.append("- `skills`: array (optional) - list of skill references")
-    lines.append("")
-    lines.append("## Assertions")
-    for model_name in assertion_models:
+    lines: list[str] = [_DOC_HEADER]
+    for model_name in _ASSERTION_MODELS:
         model_def = defs.get(model_name, {})
-        props = model_def.get("properties", {})
-        prop_keys = list(props.keys())
-        if not prop_keys:
+        top_key = next(iter(model_def.get("properties", {})), None)
+        if top_key is None:
             continue
-        top_key = prop_keys[0]
-        if top_key == "file_contains":
-            spec = defs.get("FileContainsSpec", {})
-            spec_fields = spec.get("properties", {}).keys()
-            lines.append(f"- `{top_key}`: {{ {_format_fields(spec_fields)} }}")
-        elif top_key in {"bleu", "rouge", "bertscore", "cosine_similarity"}:
-            spec = defs.get("SimilaritySpec", {})
-            spec_fields = spec.get("properties", {}).keys()
-            lines.append(f"- `{top_key}`: {{ {_format_fields(spec_fields)} }}")
+        spec_name = _SPEC_FOR_TOP_KEY.get(top_key)
+        if spec_name is None:
+            lines.append(f"- `{top_key}`: string\n")
         else:
-            lines.append(f"- `{top_key}`: string")
+            spec_fields = defs.get(spec_name, {}).get("properties", {})
+            lines.append(f"- `{top_key}`: {{ {_format_fields(spec_fields)} }}\n")
+
+    return "".join(lines)
+
 
-    lines.append("")
-    return "\n".join(lines)
+@functools.lru_cache(maxsize=1)
+def generate_schema_doc() -> str:
+    return _render_schema_doc(_build_json_schema())
 
 
 def write_schema_doc(path: Path) -> None:
     _ensure_parent(path)
     path.write_text(generate_schema_doc())
+
+
+def write_schema_files(schema_path: Path, doc_path: Path) -> None:
+    """Write the JSON Schema and its doc, overlapping the two file writes."""
+    schema_text = _json_schema_text()
+    doc_text = generate_schema_doc()
+    _ensure_parent(schema_path)
+    _ensure_parent(doc_path)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [
+            executor.submit(schema_path.write_text, schema_text),
+            executor.submit(doc_path.write_text, doc_text),
+        ]
+        for future in futures:
+            future.result()
@@ -2,11 +2,67 @@
 
 from __future__ import annotations
 
+import errno
+import os
 import shutil
+import stat
 import subprocess
+import sys
 from pathlib import Path
+from typing import Callable
+
 from pitlane.config import SkillRef
 
+_REFS_DIR = "refs"
+
+
+def _ignore_refs(_dir: str, names: list[str]) -> list[str]:
+    """copytree ignore filter: reference outputs must never reach the assistant."""
+    return [_REFS_DIR] if _REFS_DIR in names else []
+
+
+# linux/fs.h: FICLONE = _IOW(0x94, 9, int)
+_FICLONE = 0x40049409
+
+
+# Clone failures that mean the filesystem pair can't reflink at all (ext4,
+# tmpfs, cross-device, ...), as opposed to a problem with one file
+_CLONE_UNSUPPORTED = frozenset(
+    {errno.EOPNOTSUPP, errno.EXDEV, errno.EINVAL, errno.ENOTTY}
+)
+
+
+def _make_copy_function() -> Callable[[str, str], str]:
+    """Build a copytree copy_function that reflinks files where it can.
+
+    A copy-on-write clone (btrfs, XFS, ...) shares data blocks with the source
+    until either side is written, so the workspace stays isolated without the
+    bytes being copied. On filesystems without reflink support (ext4, tmpfs,
+    cross-device, ...) the first failed clone switches the rest of the tree
+    straight to shutil.copy2, so they pay for one failed ioctl, not one per file.
+    """
+    clone_supported = sys.platform == "linux"
+
+    def copy(src: str, dst: str) -> str:
+        nonlocal clone_supported
+        # Only regular files can be cloned; opening a FIFO would block, so
+        # anything else goes to copy2, which rejects it with SpecialFileError
+        if clone_supported and stat.S_ISREG(os.stat(src).st_mode):
+            import fcntl
+
+            try:
+                with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                    fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+            except OSError as e:
+                if e.errno in _CLONE_UNSUPPORTED:
+                    clone_supported = False
+            else:
+                shutil.copystat(src, dst)
+                return dst
+        return shutil.copy2(src, dst)
+
+    return copy
+
 
 class WorkspaceManager:
     """Manages isolated workspaces for evaluation runs."""
@@ -27,7 +83,8 @@ class WorkspaceManager:
         shutil.copytree(
             source_dir,
             workspace,
-            ignore=shutil.ignore_patterns("refs"),
+            ignore=_ignore_refs,
+            copy_function=_make_copy_function(),
         )
         return workspace
 
@@ -0,0 +1,6 @@
+"""PyYAML loader/dumper aliases, libyaml-backed when PyYAML was built with it."""
+
+import yaml
+
+SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+SafeDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
@@ -4,19 +4,39 @@ import logging
 import pytest
 
 
+def pytest_addoption(parser):
+    # Registered here rather than in tests/e2e/conftest.py so the option is
+    # known before that conftest is collected
+    parser.addoption(
+        "--e2e-full",
+        action="store_true",
+        default=False,
+        help="Run per-assistant E2E checks for every assistant, not just the first.",
+    )
+
+
+# Ceiling for integration tests, replacing the suite default of 60s: they
+# reach the network (e.g. a cold npx skill install) and can be slow on CI.
+_INTEGRATION_TEST_TIMEOUT = 600
+
+
+def pytest_collection_modifyitems(items) -> None:
+    for item in items:
+        if item.get_closest_marker("integration") and not item.get_closest_marker(
+            "timeout"
+        ):
+            item.add_marker(pytest.mark.timeout(_INTEGRATION_TEST_TIMEOUT))
+
+
 @pytest.fixture(autouse=True)
 def cleanup_loggers():
     """Clean up pitlane loggers after each test to prevent name collisions."""
     yield
 
-    # Remove all pitlane loggers from registry
-    loggers_to_remove = [
-        name
-        for name in logging.Logger.manager.loggerDict.keys()
-        if name.startswith("pitlane")
-    ]
-
-    for name in loggers_to_remove:
-        logger = logging.getLogger(name)
-        logger.handlers.clear()
-        del logging.Logger.manager.loggerDict[name]
+    # Remove all pitlane loggers from registry. Entries are read straight from
+    # loggerDict; getLogger() would turn placeholders into real loggers first.
+    logger_dict = logging.Logger.manager.loggerDict
+    for name in [name for name in logger_dict if name.startswith("pitlane")]:
+        logger = logger_dict.pop(name)
+        if isinstance(logger, logging.Logger):
+            logger.handlers.clear()
@@ -1,66 +1,125 @@
 """Fixtures for E2E tests that invoke real AI assistants."""
 
+import functools
 import os
+import re
+import selectors
 import shutil
 import subprocess
 import sys
-import threading
+import time
+import xml.etree.ElementTree as ET
 from pathlib import Path
 from types import SimpleNamespace
+from typing import Any
 
+import orjson
 import pytest
 
 
 def run_with_tee(cmd, *, timeout):
     """Run a subprocess, streaming output while capturing it for assertions."""
-    env = {**os.environ, "PYTHONUNBUFFERED": "1"}
+    # The child keeps its default block-buffered stdout; only the final
+    # output is asserted on, so per-write flushing would just add syscalls
     proc = subprocess.Popen(
         cmd,
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
-        text=True,
-        env=env,
+        bufsize=0,
     )
 
-    stdout_lines, stderr_lines = [], []
-
-    def _reader(stream, buf, dest):
-        for line in stream:
-            buf.append(line)
-            dest.write(line)
-            dest.flush()
-
-    t_out = threading.Thread(
-        target=_reader, args=(proc.stdout, stdout_lines, sys.stdout)
-    )
-    t_err = threading.Thread(
-        target=_reader, args=(proc.stderr, stderr_lines, sys.stderr)
-    )
-    t_out.start()
-    t_err.start()
-    proc.wait(timeout=timeout)
-    t_out.join()
-    t_err.join()
+    # Tee raw chunks from both pipes on this thread; decode once at the end
+    buffers = {proc.stdout: bytearray(), proc.stderr: bytearray()}
+    dests = {proc.stdout: sys.stdout, proc.stderr: sys.stderr}
+    deadline = time.monotonic() + timeout
+    with selectors.DefaultSelector() as sel:
+        for stream in buffers:
+            sel.register(stream, selectors.EVENT_READ)
+        while sel.get_map():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                proc.kill()
+                proc.wait()
+                raise subprocess.TimeoutExpired(cmd, timeout)
+            for key, _ in sel.select(timeout=remaining):
+                chunk = os.read(key.fd, 65536)
+                if not chunk:
+                    sel.unregister(key.fileobj)
+                    continue
+                buffers[key.fileobj] += chunk
+                dest = dests[key.fileobj]
+                dest.flush()
+                dest.buffer.write(chunk)
+                dest.buffer.flush()
+    proc.wait(timeout=max(deadline - time.monotonic(), 0))
 
     return SimpleNamespace(
         returncode=proc.returncode,
-        stdout="".join(stdout_lines),
-        stderr="".join(stderr_lines),
+        stdout=buffers[proc.stdout].decode(errors="replace"),
+        stderr=buffers[proc.stderr].decode(errors="replace"),
     )
 
 
-def _assert_cli_installed(cli_name: str) -> None:
-    """Assert that a CLI is installed; call pytest.fail() (not skip) if missing."""
-    if shutil.which(cli_name) is None:
+def _cli_installed(cli_name: str) -> bool:
+    """Return whether a CLI is on PATH."""
+    return shutil.which(cli_name) is not None
+
+
+_REQUIRED_CLIS = ("claude", "bob", "opencode", "vibe", "pitlane")
+
+
+# An autouse fixture rather than pytest_sessionstart: this conftest is only
+# loaded after session start under `pytest -m e2e`, so that hook never ran.
+# Session scope means one check per session, i.e. per xdist worker.
+@pytest.fixture(scope="session", autouse=True)
+def require_clis() -> None:
+    # PATH lookups only (no `--version` subprocesses), so a serial scan is
+    # already cheap; report every missing CLI in one failure.
+    missing = [cli for cli in _REQUIRED_CLIS if not _cli_installed(cli)]
+    if missing:
         pytest.fail(
-            f"CLI '{cli_name}' not found in PATH. Install it before running E2E tests.",
+            f"CLI(s) not found in PATH: {', '.join(missing)}. "
+            "Install them before running E2E tests.",
             pytrace=False,
         )
 
 
-def pytest_sessionstart(session) -> None:
-    for cli in ("claude", "bob", "opencode", "vibe", "pitlane"):
-        _assert_cli_installed(cli)
+# Per-test ceiling for E2E tests, fixture setup included, replacing the suite
+# default of 60s. It sits above the longest run_pipeline deadline (900s with
+# --repeat), which normally fires first and kills only the pitlane child.
+_E2E_TEST_TIMEOUT = 1200
+
+
+def pytest_collection_modifyitems(items) -> None:
+    for item in items:
+        if item.get_closest_marker("e2e") and not item.get_closest_marker("timeout"):
+            item.add_marker(pytest.mark.timeout(_E2E_TEST_TIMEOUT))
+
+
+def active_assistants(config, assistants):
+    """Assistants that get per-assistant checks: all with --e2e-full, else the first."""
+    return (
+        tuple(assistants) if config.getoption("--e2e-full") else tuple(assistants[:1])
+    )
+
+
+def pytest_generate_tests(metafunc) -> None:
+    # Per-assistant checks are parametrized from the module's ASSISTANTS. The
+    # pipeline still runs every assistant; without --e2e-full only the first
+    # one's artifacts are checked case by case.
+    assistants = getattr(metafunc.module, "ASSISTANTS", None)
+    if assistants and "assistant" in metafunc.fixturenames:
+        metafunc.parametrize(
+            "assistant", active_assistants(metafunc.config, assistants)
+        )
+
+
+@functools.lru_cache(maxsize=32)
+def _read_fixture(name: str) -> str:
+    return (Path(__file__).parent / "fixtures" / name).read_text()
+
+
+_RUN_COMPLETE = re.compile(r"^Run complete: (.+?)\r?$", re.MULTILINE)
 
 
 def run_pipeline(
@@ -79,13 +138,14 @@ def run_pipeline(
     output_dir = tmp_path_factory.mktemp("e2e_runs")
     config_dir = tmp_path_factory.mktemp("e2e_config")
 
-    fixtures_src = Path(__file__).parent / "fixtures"
     config_path = config_dir / eval_yaml_name
 
-    yaml_content = (fixtures_src / eval_yaml_name).read_text()
+    yaml_content = _read_fixture(eval_yaml_name)
     if replacements:
-        for placeholder, value in replacements.items():
-            yaml_content = yaml_content.replace(placeholder, value)
+        placeholders = re.compile("|".join(map(re.escape, replacements)))
+        yaml_content = placeholders.sub(
+            lambda m: replacements[m.group(0)], yaml_content
+        )
     config_path.write_text(yaml_content)
 
     cmd = [
@@ -103,15 +163,211 @@ def run_pipeline(
 
     result = run_with_tee(cmd, timeout=timeout)
 
-    run_dirs = sorted(output_dir.iterdir())
-    assert len(run_dirs) == 1, (
-        f"Expected 1 run dir, got: {[str(d) for d in output_dir.iterdir()]}"
-    )
-    run_dir = run_dirs[0]
+    # The CLI prints the run dir on success; only list output_dir without it
+    match = _RUN_COMPLETE.search(result.stdout)
+    if match:
+        return result, Path(match.group(1))
+
+    # Stop listing as soon as a second entry shows up; one is all we expect
+    run_dirs: list[str] = []
+    with os.scandir(output_dir) as entries:
+        for entry in entries:
+            run_dirs.append(entry.path)
+            if len(run_dirs) > 1:
+                break
+    assert len(run_dirs) == 1, f"Expected 1 run dir, got: {run_dirs}"
+    run_dir = Path(run_dirs[0])
 
     return result, run_dir
 
 
-def workspace(run_dir, assistant, task="hello-world"):
+_FIXTURES_SRC = Path(__file__).parent / "fixtures"
+
+# Assistants defined in eval-baseline.yaml
+BASELINE_ASSISTANTS = (
+    "claude-baseline",
+    "bob-baseline",
+    "opencode-baseline",
+    "vibe-baseline",
+)
+
+
+# Session-scoped so any E2E module can reuse a run without paying for another
+# round of live LLM calls. Under ``--dist=loadscope`` each consuming module is
+# pinned to one worker, so every pipeline still runs exactly once.
+@pytest.fixture(scope="session")
+def baseline_run(tmp_path_factory):
+    return run_pipeline(
+        tmp_path_factory,
+        "eval-baseline.yaml",
+        replacements={
+            "__VALIDATE_SCRIPT_PATH__": str(_FIXTURES_SRC / "validate_hello.py"),
+            "__WORKDIR_PATH__": str(_FIXTURES_SRC / "fixtures" / "empty"),
+        },
+        parallelism=len(BASELINE_ASSISTANTS),
+    )
+
+
+@pytest.fixture(scope="session")
+def mcp_run(tmp_path_factory):
+    return run_pipeline(
+        tmp_path_factory,
+        "eval-mcp.yaml",
+        replacements={
+            "__MCP_SERVER_PATH__": str(_FIXTURES_SRC / "mcp_test_server.py"),
+            "__VALIDATE_SCRIPT_PATH__": str(_FIXTURES_SRC / "validate_hello.py"),
+            "__WORKDIR_PATH__": str(_FIXTURES_SRC / "fixtures" / "empty"),
+        },
+    )
+
+
+def iteration_dir(run_dir, assistant, task="hello-world", iteration=0):
+    """Return the output directory of one assistant/task iteration."""
+    return run_dir / assistant / task / f"iter-{iteration}"
+
+
+def workspace(run_dir, assistant, task="hello-world", iteration=0):
     """Return the workspace path for a given assistant and task."""
-    return run_dir / assistant / task / "iter-0" / "workspace"
+    return iteration_dir(run_dir, assistant, task, iteration) / "workspace"
+
+
+def conversation_path(run_dir, assistant, task="hello-world", iteration=0):
+    """Return the conversation.json path for a given assistant and task."""
+    return iteration_dir(run_dir, assistant, task, iteration) / "conversation.json"
+
+
+def read_or_fail(path: Path, message: str | None = None) -> bytes:
+    """Return a file's bytes, failing the test with ``message`` if it is missing.
+
+    The read itself reports a missing file, so no exists() check is needed first.
+    """
+    try:
+        return path.read_bytes()
+    except FileNotFoundError:
+        pytest.fail(message or f"expected file missing: {path}")
+
+
+def load_meta(run_dir) -> dict[str, Any]:
+    """Parse a run's meta.yaml, with the libyaml loader when it is available."""
+    import yaml
+
+    from pitlane.yaml_compat import SafeLoader
+
+    return yaml.load((run_dir / "meta.yaml").read_bytes(), Loader=SafeLoader)
+
+
+def load_json(path: Path) -> Any:
+    """Parse a JSON file, failing the test if it was never written.
+
+    One read_bytes() call replaces an exists() check plus read_text(), and
+    orjson parses the bytes directly.
+    """
+    try:
+        return orjson.loads(path.read_bytes())
+    except FileNotFoundError as e:
+        pytest.fail(f"{path} missing: {e}")
+
+
+def parse_junit(path: Path) -> list[SimpleNamespace]:
+    """Stream junit.xml and return one lightweight record per <testsuite>.
+
+    Only the fields the E2E assertions read are kept: name, failures, time
+    and a name -> value dict of the suite properties.
+    """
+    suites = []
+    for _, el in ET.iterparse(path, events=("end",)):
+        if el.tag != "testsuite":
+            continue
+        suites.append(
+            SimpleNamespace(
+                name=el.get("name"),
+                failures=int(el.get("failures", 0)),
+                time=float(el.get("time", 0)),
+                props={
+                    p.get("name"): p.get("value")
+                    for p in el.iterfind("properties/property")
+                },
+            )
+        )
+        el.clear()
+    return suites
+
+
+def workspace_entries(run_dir) -> set[str]:
+    """Sweep every iteration workspace once and return what exists.
+
+    Returns "<assistant>/<task>/iter-<n>/workspace" for each workspace plus
+    ".../workspace/<name>" for each top-level entry in it, so existence
+    checks become set lookups instead of one stat() per parametrized case.
+    """
+    found = set()
+    for ws in Path(run_dir).glob("*/*/iter-*/workspace"):
+        rel = ws.relative_to(run_dir).as_posix()
+        found.add(rel)
+        with os.scandir(ws) as entries:
+            found.update(f"{rel}/{entry.name}" for entry in entries)
+    return found
+
+
+def load_conversations(run_dir, assistants, task="hello-world"):
+    """Parse each assistant's conversation.json once, keyed by assistant.
+
+    Assistants whose transcript is missing are left out so the individual
+    tests can report which one failed.
+    """
+    conversations = {}
+    for assistant in assistants:
+        try:
+            conversations[assistant] = orjson.loads(
+                conversation_path(run_dir, assistant, task).read_bytes()
+            )
+        except FileNotFoundError:
+            continue
+    return conversations
+
+
+def summarize_conversation(conversation: list[dict]) -> SimpleNamespace:
+    """Reduce a conversation to the facts the E2E checks assert on, in one pass.
+
+    Tool calls come in two shapes:
+    - {"tool_use": {"name": ...}} (claude, opencode, vibe)
+    - {"tool_name": ...} (bob)
+
+    Tool names keep their assistant-specific prefixes, so callers match by
+    substring:
+    - claude: mcp__pitlane-test-mcp__write_marker
+    - vibe: pitlane-test-mcp_write_marker
+    - bob: write_marker (bare)
+    """
+    tool_names = set()
+    tool_use_count = 0
+    unnamed_tool_uses = []
+    has_content = False
+    for i, entry in enumerate(conversation):
+        if "tool_use" in entry:
+            tool_use_count += 1
+            name = entry["tool_use"].get("name", "")
+            if not name:
+                unnamed_tool_uses.append((i, entry))
+            tool_names.add(name)
+        tool_names.add(entry.get("tool_name", ""))
+        if entry.get("content"):
+            has_content = True
+    tool_names.discard("")
+    return SimpleNamespace(
+        entries=len(conversation),
+        tool_use_count=tool_use_count,
+        tool_names=frozenset(tool_names),
+        unnamed_tool_uses=unnamed_tool_uses,
+        has_content=has_content,
+    )
+
+
+def load_conversation_summaries(run_dir, assistants, task="hello-world"):
+    """Summarize each assistant's conversation.json, keyed by assistant."""
+    return {
+        assistant: summarize_conversation(conversation)
+        for assistant, conversation in load_conversations(
+            run_dir, assistants, task
+        ).items()
+    }
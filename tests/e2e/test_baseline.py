@@ -3,30 +3,62 @@
 Run with: uv run pytest -m e2e -k baseline -v --tb=long
 """
 
-import json
-import subprocess
-from pathlib import Path
+import re
+from datetime import datetime
 
 import pytest
-import yaml
-from junitparser import JUnitXml
 
-from tests.e2e.conftest import run_pipeline, workspace
+from tests.e2e.conftest import (
+    BASELINE_ASSISTANTS,
+    load_conversation_summaries,
+    load_meta,
+    parse_junit,
+    workspace_entries,
+)
 
-ASSISTANTS = ("claude-baseline", "bob-baseline", "opencode-baseline", "vibe-baseline")
+ASSISTANTS = BASELINE_ASSISTANTS
 
 
 @pytest.fixture(scope="module")
-def baseline_run(tmp_path_factory):
-    fixtures_src = Path(__file__).parent / "fixtures"
-    return run_pipeline(
-        tmp_path_factory,
-        "eval-baseline.yaml",
-        replacements={
-            "__VALIDATE_SCRIPT_PATH__": str(fixtures_src / "validate_hello.py"),
-            "__WORKDIR_PATH__": str(fixtures_src / "fixtures" / "empty"),
-        },
-    )
+def junit_suites(baseline_run):
+    _, run_dir = baseline_run
+    return parse_junit(run_dir / "junit.xml")
+
+
+@pytest.fixture(scope="module")
+def conversations(baseline_run):
+    _, run_dir = baseline_run
+    return load_conversation_summaries(run_dir, ASSISTANTS)
+
+
+@pytest.fixture(scope="module")
+def workspace_files(baseline_run):
+    _, run_dir = baseline_run
+    return workspace_entries(run_dir)
+
+
+@pytest.fixture(scope="module")
+def report_html(baseline_run):
+    # Raw bytes: a missing report raises with its path, and no decode is needed
+    _, run_dir = baseline_run
+    return (run_dir / "report.html").read_bytes()
+
+
+def _invoke_cli(args):
+    # Imported here so collecting this module (e.g. under -k mcp) skips the CLI
+    from typer.testing import CliRunner
+
+    from pitlane.cli import app
+
+    return CliRunner().invoke(app, args)
+
+
+# Needs no pipeline, so it runs before the first test that triggers baseline_run
+@pytest.mark.e2e
+def test_cli_run_invalid_config():
+    result = _invoke_cli(["run", "nonexistent.yaml"])
+    assert result.exit_code == 1
+    assert "not found" in result.stderr
 
 
 @pytest.mark.e2e
@@ -45,10 +77,36 @@ def test_cli_output_shows_run_complete(baseline_run):
     assert "Run complete:" in result.stdout, f"stdout: {result.stdout}"
 
 
+# Main debug.log lines bracketing each assistant's task, with their timestamps
+_TASK_EVENT = re.compile(
+    r"^\[(?P<ts>[^\]]+)\] (?:Running task '[^']+' with assistant '(?P<start>[^']+)'"
+    r"|Task '[^']+' completed for assistant '(?P<end>[^']+)')",
+    re.MULTILINE,
+)
+
+
 @pytest.mark.e2e
-def test_junit_has_all_properties(baseline_run):
+def test_assistants_run_concurrently(baseline_run):
+    """Every assistant starts before any finishes, so their runs overlap."""
     _, run_dir = baseline_run
-    xml = JUnitXml.fromfile(str(run_dir / "junit.xml"))
+    starts, ends = {}, {}
+    for m in _TASK_EVENT.finditer((run_dir / "debug.log").read_text()):
+        ts = datetime.fromisoformat(m["ts"])
+        if m["start"]:
+            starts[m["start"]] = ts
+        else:
+            ends[m["end"]] = ts
+    assert set(starts) == set(ends) == set(ASSISTANTS), (
+        f"starts: {starts}, ends: {ends}"
+    )
+    # Timestamps have 1s resolution; a serial run would give last start >= first end
+    assert max(starts.values()) < min(ends.values()), (
+        f"Assistant runs did not overlap: starts {starts}, ends {ends}"
+    )
+
+
+@pytest.mark.e2e
+def test_junit_has_all_properties(junit_suites):
     required_keys = (
         "cost_usd",
         "token_usage_input",
@@ -60,8 +118,8 @@ def test_junit_has_all_properties(baseline_run):
         "tool_calls_count",
         "timed_out",
     )
-    for suite in xml:
-        props = {p.name: p.value for p in suite.properties()}
+    for suite in junit_suites:
+        props = suite.props
         for key in required_keys:
             assert key in props, f"Missing property '{key}' in suite '{suite.name}'"
         assert float(props["cost_usd"]) >= 0
@@ -71,10 +129,8 @@ def test_junit_has_all_properties(baseline_run):
 
 
 @pytest.mark.e2e
-def test_assertions_pass(baseline_run):
-    _, run_dir = baseline_run
-    xml = JUnitXml.fromfile(str(run_dir / "junit.xml"))
-    for suite in xml:
+def test_assertions_pass(junit_suites):
+    for suite in junit_suites:
         assert suite.failures == 0, (
             f"Suite '{suite.name}' had {suite.failures} failure(s). "
             "The LLM may not have completed all required tasks."
@@ -84,7 +140,7 @@ def test_assertions_pass(baseline_run):
 @pytest.mark.e2e
 def test_meta_yaml_complete(baseline_run):
     _, run_dir = baseline_run
-    meta = yaml.safe_load((run_dir / "meta.yaml").read_text())
+    meta = load_meta(run_dir)
     for key in (
         "run_id",
         "timestamp",
@@ -97,18 +153,16 @@ def test_meta_yaml_complete(baseline_run):
 
 
 @pytest.mark.e2e
-def test_report_has_all_assistants(baseline_run):
-    _, run_dir = baseline_run
-    report = run_dir / "report.html"
-    assert report.exists()
-    html = report.read_text()
-    for assistant in ASSISTANTS:
-        assert assistant in html, f"Assistant '{assistant}' not found in report.html"
-    assert "Cost &amp; Tokens" in html
-    assert "cost_usd" in html
-    assert "token_usage_input" in html
-    assert "badge-pass" in html or "badge-fail" in html
-    assert "hello-world" in html
+def test_report_has_all_assistants(report_html):
+    required = [a.encode() for a in ASSISTANTS] + [
+        b"Cost &amp; Tokens",
+        b"cost_usd",
+        b"token_usage_input",
+        b"hello-world",
+    ]
+    missing = [n for n in required if n not in report_html]
+    assert not missing, f"Missing from report.html: {missing}"
+    assert b"badge-pass" in report_html or b"badge-fail" in report_html
 
 
 @pytest.mark.e2e
@@ -118,71 +172,40 @@ def test_debug_log_exists(baseline_run):
 
 
 @pytest.mark.e2e
-@pytest.mark.parametrize("assistant", ASSISTANTS)
-def test_workspace_has_hello_py(baseline_run, assistant):
-    _, run_dir = baseline_run
-    assert (workspace(run_dir, assistant) / "hello.py").exists()
+def test_workspace_has_hello_py(workspace_files, assistant):
+    assert f"{assistant}/hello-world/iter-0/workspace/hello.py" in workspace_files
 
 
 @pytest.mark.e2e
-@pytest.mark.parametrize("assistant", ASSISTANTS)
-def test_workspace_has_fail_py(baseline_run, assistant):
-    _, run_dir = baseline_run
-    assert (workspace(run_dir, assistant) / "fail.py").exists()
+def test_workspace_has_fail_py(workspace_files, assistant):
+    assert f"{assistant}/hello-world/iter-0/workspace/fail.py" in workspace_files
 
 
 @pytest.mark.e2e
-@pytest.mark.parametrize("assistant", ASSISTANTS)
-def test_conversation_json_exists(baseline_run, assistant):
-    _, run_dir = baseline_run
-    conv_file = run_dir / assistant / "hello-world" / "iter-0" / "conversation.json"
-    assert conv_file.exists(), f"conversation.json not found for '{assistant}'"
-    json.loads(conv_file.read_text())
+def test_conversation_json_exists(conversations, assistant):
+    assert assistant in conversations, f"conversation.json not found for '{assistant}'"
 
 
 @pytest.mark.e2e
-@pytest.mark.parametrize("assistant", ASSISTANTS)
-def test_conversation_has_content(baseline_run, assistant):
+def test_conversation_has_content(conversations, assistant):
     """Conversation must have at least 2 entries (tool calls + text)."""
-    _, run_dir = baseline_run
-    conv_file = run_dir / assistant / "hello-world" / "iter-0" / "conversation.json"
-    conversation = json.loads(conv_file.read_text())
-    assert len(conversation) >= 2, (
-        f"Conversation for '{assistant}' has only {len(conversation)} entries, expected ≥2"
+    n_entries = conversations[assistant].entries
+    assert n_entries >= 2, (
+        f"Conversation for '{assistant}' has only {n_entries} entries, expected ≥2"
     )
 
 
 @pytest.mark.e2e
-@pytest.mark.parametrize("assistant", ASSISTANTS)
-def test_conversation_has_assistant_text(baseline_run, assistant):
+def test_conversation_has_assistant_text(conversations, assistant):
     """At least one entry must have non-empty text content from the assistant."""
-    _, run_dir = baseline_run
-    conv_file = run_dir / assistant / "hello-world" / "iter-0" / "conversation.json"
-    conversation = json.loads(conv_file.read_text())
-    has_text = any(entry.get("content") for entry in conversation)
-    assert has_text, f"No assistant text content in conversation for '{assistant}'"
-
-
-@pytest.mark.e2e
-def test_cli_run_invalid_config():
-    result = subprocess.run(
-        ["pitlane", "run", "nonexistent.yaml"],
-        capture_output=True,
-        text=True,
-        timeout=10,
+    assert conversations[assistant].has_content, (
+        f"No assistant text content in conversation for '{assistant}'"
     )
-    assert result.returncode == 1
-    assert "not found" in result.stderr
 
 
 @pytest.mark.e2e
 def test_cli_report_regenerates(baseline_run):
     _, run_dir = baseline_run
-    result = subprocess.run(
-        ["pitlane", "report", str(run_dir)],
-        capture_output=True,
-        text=True,
-        timeout=30,
-    )
-    assert result.returncode == 0
+    result = _invoke_cli(["report", str(run_dir), "--no-open"])
+    assert result.exit_code == 0
     assert "Report generated:" in result.stdout
@@ -3,50 +3,33 @@
 Run with: uv run pytest -m e2e -k mcp -v --tb=long
 """
 
-import json
-from pathlib import Path
-
 import pytest
-from junitparser import JUnitXml
 
-from tests.e2e.conftest import run_pipeline, workspace
+from tests.e2e.conftest import (
+    load_conversation_summaries,
+    parse_junit,
+    read_or_fail,
+    workspace,
+)
 
 ASSISTANTS = ("claude-mcp", "bob-mcp", "opencode-mcp", "vibe-mcp")
 
 
 @pytest.fixture(scope="module")
-def mcp_run(tmp_path_factory):
-    fixtures_src = Path(__file__).parent / "fixtures"
-    return run_pipeline(
-        tmp_path_factory,
-        "eval-mcp.yaml",
-        replacements={
-            "__MCP_SERVER_PATH__": str(fixtures_src / "mcp_test_server.py"),
-            "__VALIDATE_SCRIPT_PATH__": str(fixtures_src / "validate_hello.py"),
-            "__WORKDIR_PATH__": str(fixtures_src / "fixtures" / "empty"),
-        },
-    )
+def junit_suites(mcp_run):
+    _, run_dir = mcp_run
+    return parse_junit(run_dir / "junit.xml")
 
 
-def _has_tool_call(conversation: list[dict], tool_name: str) -> bool:
-    """Check if a tool call with the given name exists in the conversation.
+@pytest.fixture(scope="module")
+def junit_props(junit_suites):
+    return {s.name: s.props for s in junit_suites}
 
-    Handles both formats:
-    - {"tool_use": {"name": ...}} (claude, opencode, vibe)
-    - {"tool_name": ...} (bob)
 
-    Uses substring match to handle assistant-specific prefixes:
-    - claude: mcp__pitlane-test-mcp__write_marker
-    - vibe: pitlane-test-mcp_write_marker
-    - bob: write_marker (bare)
-    """
-    for entry in conversation:
-        name = entry.get("tool_use", {}).get("name", "")
-        if tool_name in name:
-            return True
-        if tool_name in entry.get("tool_name", ""):
-            return True
-    return False
+@pytest.fixture(scope="module")
+def conversations(mcp_run):
+    _, run_dir = mcp_run
+    return load_conversation_summaries(run_dir, ASSISTANTS)
 
 
 @pytest.mark.e2e
@@ -60,10 +43,8 @@ def test_cli_exits_zero(mcp_run):
 
 
 @pytest.mark.e2e
-def test_assertions_pass(mcp_run):
-    _, run_dir = mcp_run
-    xml = JUnitXml.fromfile(str(run_dir / "junit.xml"))
-    for suite in xml:
+def test_assertions_pass(junit_suites):
+    for suite in junit_suites:
         assert suite.failures == 0, (
             f"Suite '{suite.name}' had {suite.failures} failure(s). "
             "The LLM may not have completed all required tasks."
@@ -71,59 +52,46 @@ def test_assertions_pass(mcp_run):
 
 
 @pytest.mark.e2e
-@pytest.mark.parametrize("assistant", ASSISTANTS)
 def test_mcp_marker_proves_tool_used(mcp_run, assistant):
     _, run_dir = mcp_run
     marker = workspace(run_dir, assistant) / ".mcp_marker"
-    assert marker.exists(), (
-        f"MCP marker file not found for '{assistant}' — MCP tool was not invoked"
+    content = read_or_fail(
+        marker,
+        f"MCP marker file not found for '{assistant}' — MCP tool was not invoked",
     )
-    assert "PITLANE_MCP_MARKER_a9f3e7b2" in marker.read_text()
+    assert b"PITLANE_MCP_MARKER_a9f3e7b2" in content
 
 
 @pytest.mark.e2e
-@pytest.mark.parametrize("assistant", ASSISTANTS)
-def test_mcp_tool_call_in_conversation(mcp_run, assistant):
-    _, run_dir = mcp_run
-    conv_file = run_dir / assistant / "hello-world" / "iter-0" / "conversation.json"
-    assert conv_file.exists(), f"conversation.json not found for '{assistant}'"
-    conversation = json.loads(conv_file.read_text())
-    assert _has_tool_call(conversation, "write_marker"), (
+def test_mcp_tool_call_in_conversation(conversations, assistant):
+    assert assistant in conversations, f"conversation.json not found for '{assistant}'"
+    tool_names = conversations[assistant].tool_names
+    assert any("write_marker" in name for name in tool_names), (
         f"No 'write_marker' tool call found in conversation for '{assistant}'"
     )
 
 
 @pytest.mark.e2e
-@pytest.mark.parametrize("assistant", ASSISTANTS)
-def test_conversation_tool_calls_have_names(mcp_run, assistant):
+def test_conversation_tool_calls_have_names(conversations, assistant):
     """Every tool_use entry must have a non-empty tool name."""
-    _, run_dir = mcp_run
-    conv_file = run_dir / assistant / "hello-world" / "iter-0" / "conversation.json"
-    conversation = json.loads(conv_file.read_text())
-    for i, entry in enumerate(conversation):
-        if "tool_use" in entry:
-            name = entry["tool_use"].get("name", "")
-            assert name, f"Entry {i} for '{assistant}' has empty tool_use.name: {entry}"
+    unnamed = conversations[assistant].unnamed_tool_uses
+    assert not unnamed, (
+        f"Entries for '{assistant}' have empty tool_use.name (index, entry): {unnamed}"
+    )
 
 
 @pytest.mark.e2e
-@pytest.mark.parametrize("assistant", ASSISTANTS)
-def test_conversation_tool_count_matches_junit(mcp_run, assistant):
+def test_conversation_tool_count_matches_junit(junit_props, conversations, assistant):
     """tool_calls_count in JUnit must match number of tool_use entries in conversation."""
-    _, run_dir = mcp_run
-    xml = JUnitXml.fromfile(str(run_dir / "junit.xml"))
-    junit_count = None
-    for suite in xml:
-        if assistant in suite.name:
-            for p in suite.properties():
-                if p.name == "tool_calls_count":
-                    junit_count = int(float(p.value))
-            break
-    assert junit_count is not None, f"No tool_calls_count in JUnit for '{assistant}'"
-
-    conv_file = run_dir / assistant / "hello-world" / "iter-0" / "conversation.json"
-    conversation = json.loads(conv_file.read_text())
-    conv_count = sum(1 for e in conversation if "tool_use" in e)
+    props = next(
+        (props for name, props in junit_props.items() if assistant in name), {}
+    )
+    assert "tool_calls_count" in props, (
+        f"No tool_calls_count in JUnit for '{assistant}'"
+    )
+    junit_count = int(float(props["tool_calls_count"]))
+
+    conv_count = conversations[assistant].tool_use_count
 
     assert conv_count == junit_count, (
         f"Mismatch for '{assistant}': {conv_count} tool_use entries in conversation "
@@ -135,6 +103,6 @@ def test_conversation_tool_count_matches_junit(mcp_run, assistant):
 def test_report_shows_tool_calls(mcp_run):
     """Report HTML must render TOOL badges and tool names in transcripts."""
     _, run_dir = mcp_run
-    html = (run_dir / "report.html").read_text()
-    assert "badge-role-tool" in html, "No TOOL badges found in report"
-    assert "write_marker" in html, "Tool name 'write_marker' not found in report"
+    html = (run_dir / "report.html").read_bytes()
+    assert b"badge-role-tool" in html, "No TOOL badges found in report"
+    assert b"write_marker" in html, "Tool name 'write_marker' not found in report"
@@ -1,21 +1,24 @@
 """E2E tests for --repeat: verify all iterations run cleanly for every assistant.
 
-Runs `pitlane run --repeat 3 --parallel 4` with all 4 assistants against the
+Runs `pitlane run --repeat 3 --parallel 12` with all 4 assistants against the
 shared eval fixture. All tests in this module share a single CLI invocation
 via the module-scoped `pipeline_run_repeat` fixture.
 
 Run with: uv run pytest -m e2e -v --tb=long
 """
 
-import itertools
-import json
 from pathlib import Path
 
 import pytest
-import yaml
-from junitparser import JUnitXml
 
-from tests.e2e.conftest import run_pipeline
+from tests.e2e.conftest import (
+    conversation_path,
+    load_json,
+    load_meta,
+    parse_junit,
+    run_pipeline,
+    workspace_entries,
+)
 
 _ASSISTANTS = ("claude-baseline", "bob-baseline", "opencode-baseline", "vibe-baseline")
 _REPEAT_COUNT = 3
@@ -32,11 +35,19 @@ def pipeline_run_repeat(tmp_path_factory):
             "__VALIDATE_SCRIPT_PATH__": str(fixtures_src / "validate_hello.py"),
             "__WORKDIR_PATH__": str(fixtures_src / "fixtures" / "empty"),
         },
+        # Every iteration in one wave: the jobs wait on remote LLMs, not local CPU
+        parallelism=len(_ASSISTANTS) * _REPEAT_COUNT,
         extra_args=["--repeat", str(_REPEAT_COUNT)],
         timeout=900,
     )
 
 
+@pytest.fixture(scope="module")
+def workspace_files(pipeline_run_repeat):
+    _, run_dir = pipeline_run_repeat
+    return workspace_entries(run_dir)
+
+
 @pytest.mark.e2e
 def test_repeat_cli_exits_zero(pipeline_run_repeat):
     result, _ = pipeline_run_repeat
@@ -50,41 +61,30 @@ def test_repeat_cli_exits_zero(pipeline_run_repeat):
 @pytest.mark.e2e
 def test_repeat_meta_yaml_records_repeat_count(pipeline_run_repeat):
     _, run_dir = pipeline_run_repeat
-    meta = yaml.safe_load((run_dir / "meta.yaml").read_text())
+    meta = load_meta(run_dir)
     assert meta.get("repeat") == _REPEAT_COUNT
 
 
 @pytest.mark.e2e
-@pytest.mark.parametrize(
-    "assistant,iteration",
-    list(itertools.product(_ASSISTANTS, range(_REPEAT_COUNT))),
-)
-def test_repeat_workspace_exists(pipeline_run_repeat, assistant, iteration):
-    _, run_dir = pipeline_run_repeat
-    ws = run_dir / assistant / "hello-world" / f"iter-{iteration}" / "workspace"
-    assert ws.exists(), f"Workspace missing for {assistant} iter-{iteration}"
+@pytest.mark.parametrize("iteration", range(_REPEAT_COUNT))
+@pytest.mark.parametrize("assistant", _ASSISTANTS)
+def test_repeat_workspace_exists(workspace_files, assistant, iteration):
+    ws = f"{assistant}/hello-world/iter-{iteration}/workspace"
+    assert ws in workspace_files, f"Workspace missing for {assistant} iter-{iteration}"
 
 
 @pytest.mark.e2e
-@pytest.mark.parametrize(
-    "assistant,iteration",
-    list(itertools.product(_ASSISTANTS, range(_REPEAT_COUNT))),
-)
+@pytest.mark.parametrize("iteration", range(_REPEAT_COUNT))
+@pytest.mark.parametrize("assistant", _ASSISTANTS)
 def test_repeat_conversation_json_exists(pipeline_run_repeat, assistant, iteration):
     _, run_dir = pipeline_run_repeat
-    conv_file = (
-        run_dir / assistant / "hello-world" / f"iter-{iteration}" / "conversation.json"
-    )
-    assert conv_file.exists(), (
-        f"conversation.json missing for {assistant} iter-{iteration}"
-    )
-    json.loads(conv_file.read_text())
+    load_json(conversation_path(run_dir, assistant, iteration=iteration))
 
 
 @pytest.mark.e2e
 def test_repeat_junit_has_all_assistants(pipeline_run_repeat):
     _, run_dir = pipeline_run_repeat
-    xml = JUnitXml.fromfile(str(run_dir / "junit.xml"))
+    xml = parse_junit(run_dir / "junit.xml")
     suite_names = {suite.name for suite in xml}
     for assistant in _ASSISTANTS:
         assert any(assistant in name for name in suite_names), (
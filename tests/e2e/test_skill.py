@@ -6,9 +6,8 @@ Run with: uv run pytest -m e2e -k skill -v --tb=long
 from pathlib import Path
 
 import pytest
-from junitparser import JUnitXml
 
-from tests.e2e.conftest import run_pipeline, workspace
+from tests.e2e.conftest import parse_junit, read_or_fail, run_pipeline, workspace
 
 ASSISTANTS = ("claude-skill", "opencode-skill", "vibe-skill")
 
@@ -40,7 +39,7 @@ def test_cli_exits_zero(skill_run):
 @pytest.mark.e2e
 def test_assertions_pass(skill_run):
     _, run_dir = skill_run
-    xml = JUnitXml.fromfile(str(run_dir / "junit.xml"))
+    xml = parse_junit(run_dir / "junit.xml")
     for suite in xml:
         assert suite.failures == 0, (
             f"Suite '{suite.name}' had {suite.failures} failure(s). "
@@ -49,14 +48,12 @@ def test_assertions_pass(skill_run):
 
 
 @pytest.mark.e2e
-@pytest.mark.parametrize("assistant", ASSISTANTS)
 def test_skill_marker_in_generated_files(skill_run, assistant):
     """Skill instructions must be followed: generated files contain the skill marker."""
     _, run_dir = skill_run
     hello_py = workspace(run_dir, assistant) / "hello.py"
-    assert hello_py.exists(), f"hello.py not found for '{assistant}'"
-    content = hello_py.read_text()
-    assert "Generated with pitlane-test skill" in content, (
+    content = read_or_fail(hello_py, f"hello.py not found for '{assistant}'")
+    assert b"Generated with pitlane-test skill" in content, (
         f"Skill marker not found in hello.py for '{assistant}' — "
         f"agent did not follow pitlane-test skill instructions"
     )
@@ -110,6 +110,8 @@ def test_evaluate_assertion_unknown_type():
         evaluate_assertion("/tmp", {"bogus_check": "value"})
 
 
+# First use downloads the rouge metric from the hub; allow for a cold cache
+@pytest.mark.timeout(600)
 def test_evaluate_assertion_similarity_runs(tmp_path):
     (tmp_path / "a.txt").write_text("hello world")
     (tmp_path / "b.txt").write_text("hello world")
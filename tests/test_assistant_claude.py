@@ -192,6 +192,24 @@ def test_claude_with_invalid_response_format():
     assert cost == 0.01
 
 
+def test_parse_result_with_nan_falls_back_to_json():
+    """A result event orjson rejects (NaN) is still parsed via stdlib json."""
+    adapter = ClaudeCodeAssistant()
+    stdout = json.dumps(
+        {
+            "type": "result",
+            "subtype": "success",
+            "duration_ms": float("nan"),
+            "total_cost_usd": 0.03,
+            "usage": {"input_tokens": 40, "output_tokens": 20},
+        }
+    )
+    _, token_usage, cost, _ = adapter._parse_output(stdout)
+    assert token_usage["input"] == 40
+    assert token_usage["output"] == 20
+    assert cost == 0.03
+
+
 def test_claude_with_empty_response():
     """Test claude adapter handles empty or whitespace-only response."""
     adapter = ClaudeCodeAssistant()
@@ -249,18 +267,6 @@ def test_claude_with_all_options_combined():
     assert cmd[-1] == "complex task"
 
 
-def test_claude_cli_name():
-    """Test claude adapter returns correct CLI name."""
-    adapter = ClaudeCodeAssistant()
-    assert adapter.cli_name() == "claude"
-
-
-def test_claude_agent_type():
-    """Test claude adapter returns correct agent type."""
-    adapter = ClaudeCodeAssistant()
-    assert adapter.agent_type() == "claude-code"
-
-
 def test_claude_get_cli_version_success(mocker, monkeypatch):
     """Test claude adapter gets CLI version successfully."""
     adapter = ClaudeCodeAssistant()
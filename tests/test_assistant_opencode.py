@@ -159,12 +159,6 @@ def test_get_cli_version_empty_output(mocker):
     assert version is None
 
 
-def test_cli_name():
-    adapter = OpenCodeAssistant()
-    assert adapter.cli_name() == "opencode"
-    assert adapter.agent_type() == "opencode"
-
-
 def test_build_command_with_session_management():
     adapter = OpenCodeAssistant()
     cmd = adapter._build_command(
@@ -322,6 +316,23 @@ def test_parse_output_json_decode_error():
     assert tool_calls_count == 1
 
 
+def test_parse_step_finish_with_nan_falls_back_to_json():
+    """A step_finish event orjson rejects (NaN) is still parsed via stdlib json."""
+    adapter = OpenCodeAssistant()
+    stdout = json.dumps(
+        {
+            "type": "step_finish",
+            "part": {
+                "tokens": {"input": 10, "output": 5, "reasoning": float("nan")},
+                "cost": 0,
+            },
+        }
+    )
+    _, token_usage, _, _ = adapter._parse_output(stdout)
+    assert token_usage["input"] == 10
+    assert token_usage["output"] == 5
+
+
 def test_parse_output_alternative_message_types():
     """Test parsing output with alternative message type names."""
     adapter = OpenCodeAssistant()
@@ -1,7 +1,8 @@
 import pytest
 
 from pitlane.assistants import get_assistant
-from pitlane.assistants.base import AssistantResult, BaseAssistant
+from pitlane.assistants.base import AssistantResult, BaseAssistant, parse_json_line
+from pitlane.assistants.bob import BobAssistant
 from pitlane.assistants.claude_code import ClaudeCodeAssistant
 from pitlane.assistants.mistral_vibe import MistralVibeAssistant
 from pitlane.assistants.opencode import OpenCodeAssistant
@@ -42,6 +43,7 @@ class TestGetAdapter:
     @pytest.mark.parametrize(
         "name,expected_type,cli,agent",
         [
+            ("bob", BobAssistant, "bob", "bob"),
             ("claude-code", ClaudeCodeAssistant, "claude", "claude-code"),
             ("mistral-vibe", MistralVibeAssistant, "vibe", "mistral-vibe"),
             ("opencode", OpenCodeAssistant, "opencode", "opencode"),
@@ -57,3 +59,22 @@ class TestGetAdapter:
     def test_get_assistant_unknown_raises(self):
         with pytest.raises(ValueError, match="Unknown assistant"):
             get_assistant("unknown-agent")
+
+
+class TestParseJsonLine:
+    def test_parses_object_line(self):
+        assert parse_json_line('  {"type": "result"}') == {"type": "result"}
+
+    @pytest.mark.parametrize("line", ["", "   ", "Loading...", "[1, 2]", "{broken"])
+    def test_rejects_non_object_lines(self, line):
+        assert parse_json_line(line) is None
+
+    def test_falls_back_to_json_for_nan(self):
+        result = parse_json_line('{"duration_ms": NaN}')
+        assert result is not None
+        assert result["duration_ms"] != result["duration_ms"]
+
+    def test_rejects_chatter_without_parsing(self, mocker):
+        loads = mocker.patch("pitlane.assistants.base.orjson.loads")
+        assert parse_json_line("Starting session") is None
+        loads.assert_not_called()
@@ -6,7 +6,7 @@ from pathlib import Path
 import pytest
 from pydantic import ValidationError
 
-from pitlane.config import SkillRef, load_config
+from pitlane.config import McpServerConfig, SkillRef, load_config
 
 
 def _example_configs() -> list[Path]:
@@ -481,6 +481,19 @@ def test_mcp_env_validation_plain_text(tmp_yaml):
     assert cfg.assistants["bob"].mcps[0].env["PLAIN_VALUE"] == "just-a-string"
 
 
+def test_mcp_env_validation_skips_expansion_for_plain_values(mocker):
+    """Values without $ or escapes never reach expandvars."""
+    spy = mocker.patch("pitlane.config.expandvars")
+    McpServerConfig(name="m", command="uvx", env={"A": "plain", "B": "also-plain"})
+    spy.assert_not_called()
+
+
+def test_mcp_env_validation_trailing_escape_is_reported():
+    """A dangling escape character is still rejected by validation."""
+    with pytest.raises(ValueError, match="missing environment variables"):
+        McpServerConfig(name="m", command="uvx", env={"A": "bad\\"})
+
+
 def test_mcp_env_validation_mixed_vars(tmp_yaml, monkeypatch):
     """MCP config validation should handle mix of set vars, defaults, and plain text."""
     monkeypatch.setenv("SET_VAR", "value1")
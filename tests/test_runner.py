@@ -57,6 +57,28 @@ def test_runner_creates_run_directory(mocker, tmp_path, eval_config):
     assert not (run_dir / "results.json").exists()
 
 
+def test_runner_probes_cli_version_once(mocker, tmp_path, eval_config):
+    runner = Runner(
+        config=eval_config, output_dir=tmp_path / "runs", verbose=False, repeat=3
+    )
+
+    mocker.patch(
+        "pitlane.assistants.claude_code.ClaudeCodeAssistant.run",
+        return_value=AssistantResult(
+            stdout="", stderr="", exit_code=0, duration_seconds=1.0
+        ),
+    )
+    version_probe = mocker.patch(
+        "pitlane.assistants.claude_code.ClaudeCodeAssistant.get_cli_version",
+        return_value="1.2.3",
+    )
+    run_dir = runner.execute()
+
+    assert version_probe.call_count == 1
+    meta = yaml.safe_load((run_dir / "meta.yaml").read_text())
+    assert meta["cli_versions"] == {"mock-claude (claude)": "1.2.3"}
+
+
 def test_runner_captures_results(mocker, tmp_path, eval_config):
     runner = Runner(config=eval_config, output_dir=tmp_path / "runs", verbose=False)
 
@@ -459,6 +481,52 @@ tasks:
     assert meta["interrupted"] is True
 
 
+def test_runner_interrupt_does_not_duplicate_iterations(mocker, tmp_path, eval_config):
+    """Iterations collected before Ctrl+C must not be re-added during recovery."""
+    completed_result = {
+        "metrics": {"wall_clock_seconds": 0.1, "weighted_score": 100.0},
+        "assertions": [
+            {
+                "name": "file_exists: hello.py",
+                "passed": True,
+                "message": "ok",
+                "score": 1.0,
+                "weight": 1.0,
+            }
+        ],
+        "all_passed": True,
+    }
+
+    original_as_completed = as_completed
+
+    def mock_as_completed(futures):
+        iterator = original_as_completed(futures)
+        yield next(iterator)
+        yield next(iterator)
+        raise KeyboardInterrupt()
+
+    runner = Runner(
+        config=eval_config,
+        output_dir=tmp_path / "runs",
+        verbose=False,
+        parallel_tasks=4,
+        repeat=4,
+    )
+
+    mocker.patch.object(runner, "_run_task", return_value=completed_result)
+    mocker.patch("pitlane.runner.as_completed", side_effect=mock_as_completed)
+    aggregate_spy = mocker.patch(
+        "pitlane.runner.aggregate_results", side_effect=aggregate_results
+    )
+    runner.execute()
+
+    assert runner.interrupted is True
+    (results_list,) = aggregate_spy.call_args.args
+    indices = [r.iteration_index for r in results_list]
+    assert len(indices) >= 2
+    assert indices == sorted(set(indices))
+
+
 @pytest.fixture
 def multi_assistant_config(tmp_path):
     fixture_dir = tmp_path / "fixtures" / "empty"
@@ -0,0 +1,115 @@
+import json
+
+import pytest
+
+import pitlane.schema as schema_module
+from pitlane.config import EvalConfig
+from pitlane.schema import (
+    _build_json_schema,
+    _collect_refs,
+    _json_schema_text,
+    _order_defs,
+    generate_json_schema,
+    generate_schema_doc,
+    write_json_schema,
+    write_schema_doc,
+    write_schema_files,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_schema_cache():
+    caches = (_build_json_schema, _json_schema_text, generate_schema_doc)
+    for cached in caches:
+        cached.cache_clear()
+    yield
+    for cached in caches:
+        cached.cache_clear()
+
+
+def test_schema_doc_is_rendered_once(mocker):
+    spy = mocker.spy(schema_module, "_render_schema_doc")
+    first = generate_schema_doc()
+    assert generate_schema_doc() is first
+    assert spy.call_count == 1
+
+
+def test_schema_is_built_once(mocker):
+    spy = mocker.spy(EvalConfig, "model_json_schema")
+    generate_json_schema()
+    generate_schema_doc()
+    generate_json_schema()
+    assert spy.call_count == 1
+
+
+def test_generate_json_schema_returns_independent_copies():
+    first = generate_json_schema()
+    first["$defs"].clear()
+    second = generate_json_schema()
+    assert second["$defs"]
+
+
+def test_write_json_schema_matches_generated_schema(tmp_path):
+    out = tmp_path / "nested" / "schema.json"
+    write_json_schema(out)
+    assert json.loads(out.read_text()) == generate_json_schema()
+    assert out.read_text().endswith("}\n")
+
+
+def test_order_defs_places_dependencies_first():
+    defs = {
+        "A": {"properties": {"b": {"$ref": "#/$defs/B"}, "c": {"$ref": "#/$defs/C"}}},
+        "B": {"items": [{"$ref": "#/$defs/C"}]},
+        "C": {"type": "string"},
+        "D": {"$ref": "#/$defs/Missing"},
+    }
+    assert list(_order_defs(defs)) == ["C", "B", "A", "D"]
+
+
+def test_order_defs_handles_deep_chains():
+    depth = 5000
+    defs = {f"T{i}": {"$ref": f"#/$defs/T{i + 1}"} for i in range(depth)}
+    defs[f"T{depth}"] = {"type": "string"}
+    ordered = list(_order_defs(defs))
+    assert ordered == [f"T{i}" for i in range(depth, -1, -1)]
+
+
+def test_collect_refs_walks_nested_structures():
+    schema = {
+        "properties": {
+            "a": {"$ref": "#/$defs/A"},
+            "b": {"anyOf": [{"$ref": "#/$defs/B"}, {"items": {"$ref": "#/$defs/A"}}]},
+            "ext": {"$ref": "https://example.com/other.json"},
+        }
+    }
+    assert _collect_refs(schema) == {"A", "B"}
+
+
+def test_collect_refs_follows_siblings_of_ref():
+    schema = {"$ref": "#/$defs/A", "default": {"items": {"$ref": "#/$defs/B"}}}
+    assert _collect_refs(schema) == {"A", "B"}
+
+
+def test_schema_doc_lists_assertions(tmp_path):
+    doc = generate_schema_doc()
+    assert doc.startswith("# pitlane YAML Schema\n")
+    assert doc.endswith("\n") and not doc.endswith("\n\n")
+    assert "- `file_exists`: string\n" in doc
+    assert "- `file_contains`: { path, pattern }\n" in doc
+    assert "- `bleu`: { actual, expected, metric, min_score }\n" in doc
+
+    out = tmp_path / "docs" / "schema.md"
+    write_schema_doc(out)
+    assert out.read_text() == doc
+
+
+def test_write_schema_files_writes_both_outputs(tmp_path, mocker):
+    spy = mocker.spy(EvalConfig, "model_json_schema")
+    schema_path = tmp_path / "schemas" / "pitlane.schema.json"
+    doc_path = tmp_path / "docs" / "schema.md"
+
+    write_schema_files(schema_path, doc_path)
+
+    assert json.loads(schema_path.read_text()) == generate_json_schema()
+    assert doc_path.read_text() == generate_schema_doc()
+    assert spy.call_count == 1
@@ -1,11 +1,15 @@
 """Tests for WorkspaceManager."""
 
+import errno
+import os
+import shutil
+import sys
 from pathlib import Path
 
 import pytest
 
 from pitlane.config import SkillRef
-from pitlane.workspace import WorkspaceManager
+from pitlane.workspace import WorkspaceManager, _make_copy_function
 
 
 @pytest.fixture
@@ -67,6 +71,85 @@ def test_create_workspace_excludes_refs(manager: WorkspaceManager, tmp_path: Pat
     assert not (ws / "refs").exists(), "refs/ should be excluded from workspace"
 
 
+def test_create_workspace_excludes_nested_refs(
+    manager: WorkspaceManager, tmp_path: Path
+):
+    src = tmp_path / "nested_refs"
+    (src / "pkg" / "refs").mkdir(parents=True)
+    (src / "pkg" / "refs" / "expected.py").write_text("golden output")
+    (src / "pkg" / "refs.py").write_text("not a refs dir")
+
+    ws = manager.create_workspace(
+        source_dir=src,
+        run_id="run-nested",
+        assistant_name="test",
+        task_name="task-nested",
+    )
+
+    assert not (ws / "pkg" / "refs").exists()
+    assert (ws / "pkg" / "refs.py").exists()
+
+
+def test_create_workspace_is_isolated_from_source(
+    manager: WorkspaceManager, source_dir: Path
+):
+    """In-place writes inside the workspace must never reach the fixture."""
+    (source_dir / "run.sh").write_text("#!/bin/sh\n")
+    (source_dir / "run.sh").chmod(0o755)
+
+    ws = manager.create_workspace(
+        source_dir=source_dir,
+        run_id="run-iso",
+        assistant_name="test",
+        task_name="task-iso",
+    )
+    with open(ws / "README.md", "r+") as f:
+        f.write("# Edited")
+
+    assert (source_dir / "README.md").read_text() == "# Hello"
+    assert (ws / "run.sh").stat().st_mode & 0o777 == 0o755
+
+
+def test_copy_function_falls_back_to_copy(tmp_path: Path, mocker):
+    src = tmp_path / "src.txt"
+    src.write_text("payload")
+    dst = tmp_path / "dst.txt"
+    mocker.patch("fcntl.ioctl", side_effect=OSError("not supported"))
+
+    assert _make_copy_function()(str(src), str(dst)) == str(dst)
+    assert dst.read_text() == "payload"
+
+
+@pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="needs os.mkfifo")
+def test_copy_function_rejects_fifo(tmp_path: Path):
+    src = tmp_path / "pipe"
+    os.mkfifo(src)
+    dst = tmp_path / "dst"
+
+    with pytest.raises(shutil.SpecialFileError):
+        _make_copy_function()(str(src), str(dst))
+
+
+@pytest.mark.skipif(sys.platform != "linux", reason="FICLONE is Linux-only")
+def test_create_workspace_stops_cloning_once_unsupported(
+    manager: WorkspaceManager, source_dir: Path, mocker
+):
+    ioctl = mocker.patch(
+        "fcntl.ioctl", side_effect=OSError(errno.EOPNOTSUPP, "not supported")
+    )
+
+    ws = manager.create_workspace(
+        source_dir=source_dir,
+        run_id="run-001",
+        assistant_name="claude-baseline",
+        task_name="hello-world",
+    )
+
+    assert ioctl.call_count == 1
+    assert (ws / "README.md").read_text() == "# Hello"
+    assert (ws / "sub" / "deep" / "file.txt").read_text() == "nested content"
+
+
 def test_install_skill_includes_skill_flag(
     manager: WorkspaceManager, tmp_path: Path, monkeypatch
 ):